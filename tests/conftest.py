@@ -0,0 +1,141 @@
+"""
+Live Q&A Platform - Shared Test Fixtures
+========================================
+Fixtures shared across the test suite.
+
+Browser start-up dominates the browser suite's run time, so a single
+Chromium instance is launched once per session and every test gets its
+own lightweight, isolated browser context instead of a new browser.
+"""
+
+import os
+import time
+
+import pytest
+import requests
+from playwright.sync_api import Error as PlaywrightError, expect, sync_playwright
+
+FRONTEND_URL = "http://localhost:3001"
+
+# How long to keep polling for the frontend before giving up
+SERVER_READY_TIMEOUT = 5
+
+# Default wait for locators, navigation and expect() assertions, in seconds
+TIMEOUT = 10
+expect.set_options(timeout=TIMEOUT * 1000)
+
+# Analytics and web-font requests that would otherwise hold up page loads
+THIRD_PARTY_URLS = [
+    "*google-analytics*",
+    "*googletagmanager*",
+    "*.woff2",
+    "*fonts.gstatic.com*"
+]
+
+# Images that DOM-only tests never look at (with or without a query string)
+IMAGE_URLS = ["*/_next/image*"] + [
+    pattern
+    for ext in ("png", "jpg", "jpeg", "gif", "webp", "avif", "svg", "ico")
+    for pattern in (f"*.{ext}", f"*.{ext}?*")
+]
+
+
+def pytest_configure(config):
+    """Register the markers used to split quick HTTP checks from browser tests"""
+    config.addinivalue_line("markers", "browser: requires a Chromium browser")
+    config.addinivalue_line("markers", "http: pure HTTP checks, no browser needed")
+
+
+def _frontend_up():
+    """Return True once the frontend answers HTTP requests"""
+    try:
+        requests.get(FRONTEND_URL, timeout=2)
+        return True
+    except requests.exceptions.RequestException:
+        return False
+
+
+@pytest.fixture(scope="session")
+def frontend_ready():
+    """Poll the frontend once per session, failing the browser tests fast if it is down"""
+    deadline = time.monotonic() + SERVER_READY_TIMEOUT
+    delay = 0.25
+    up = _frontend_up()
+    while not up and time.monotonic() < deadline:
+        time.sleep(delay)
+        delay = min(delay * 2, 2)
+        up = _frontend_up()
+
+    if not up:
+        pytest.fail(f"Frontend not reachable at {FRONTEND_URL}")
+
+
+@pytest.fixture(scope="session")
+def browser(frontend_ready):
+    """Chromium instance shared by every browser test in the session"""
+    with sync_playwright() as playwright:
+        try:
+            # Run headless unless HEADLESS=0 is set for local debugging
+            chromium = playwright.chromium.launch(
+                headless=os.getenv("HEADLESS", "1") != "0",
+                args=[
+                    '--disable-dev-shm-usage',
+                    '--disable-background-networking',
+                    '--disable-sync',
+                    '--disable-default-apps',
+                    '--disable-translate',
+                    '--mute-audio'
+                ]
+            )
+        except PlaywrightError as e:
+            pytest.skip(f"Could not launch Chromium. Error: {e}")
+
+        yield chromium
+
+        chromium.close()
+
+
+def _new_page(browser, lightweight=True, **context_options):
+    """Open a page in a fresh browser context without third-party assets; lightweight pages also skip images"""
+    context_options.setdefault("viewport", {"width": 1920, "height": 1080})
+    context = browser.new_context(**context_options)
+    context.set_default_timeout(TIMEOUT * 1000)
+    page = context.new_page()
+
+    # Block over DevTools rather than context.route(), which turns off the HTTP cache
+    cdp = context.new_cdp_session(page)
+    cdp.send("Network.enable")
+    cdp.send("Network.setCacheDisabled", {"cacheDisabled": False})
+    blocked_urls = THIRD_PARTY_URLS + (IMAGE_URLS if lightweight else [])
+    cdp.send("Network.setBlockedURLs", {"urls": blocked_urls})
+    return context, page
+
+
+@pytest.fixture
+def page(browser):
+    """Isolated page for a single DOM test"""
+    context, page = _new_page(browser)
+    yield page
+    context.close()
+
+
+@pytest.fixture
+def full_page(browser):
+    """Page that still loads images, for real load-time measurements"""
+    context, page = _new_page(browser, lightweight=False)
+    yield page
+    context.close()
+
+
+@pytest.fixture
+def mobile_page(browser):
+    """Page in a phone-sized context (iPhone 12 Pro viewport)"""
+    context, page = _new_page(
+        browser,
+        viewport={"width": 390, "height": 844},
+        device_scale_factor=3,
+        is_mobile=True,
+        has_touch=True
+    )
+    yield page
+    context.close()
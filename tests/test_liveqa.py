@@ -1,107 +1,45 @@
 """
-Live Q&A Platform - Selenium Test Suite
-========================================
+Live Q&A Platform - Browser Test Suite
+======================================
 This test suite contains 10 simple test cases covering core functionality
-of the Live Q&A with Real-Time Voting platform.
+of the Live Q&A with Real-Time Voting platform, driven by Playwright.
 
 Prerequisites:
 - Frontend running on http://localhost:3001
 - Backend running on http://localhost:3000
+- Chromium installed for Playwright (python -m playwright install chromium)
 - Valid test user credentials or Google OAuth configured
 """
 
+import os
+import re
 import time
 import pytest
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.common.keys import Keys
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.webdriver.chrome.service import Service
+from playwright.sync_api import Error as PlaywrightError, expect
 
+from conftest import FRONTEND_URL
 
+
+@pytest.mark.browser
 class TestLiveQA:
     """Test suite for Live Q&A Platform"""
     
-    BASE_URL = "http://localhost:3001"
-    TIMEOUT = 10
-    
-    @pytest.fixture(autouse=True)
-    def setup_and_teardown(self):
-        """Setup and teardown for each test"""
-        # Setup Chrome options for Windows compatibility
-        chrome_options = webdriver.ChromeOptions()
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--disable-extensions')
-        chrome_options.add_argument('--disable-web-security')
-        chrome_options.add_argument('--allow-running-insecure-content')
-        chrome_options.add_argument('--remote-debugging-port=9222')
-        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-        
-        # Add experimental options
-        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-        
-        self.driver = None
-        last_error = None
-        
-        # Try multiple approaches to initialize Chrome
-        approaches = [
-            self._try_system_chrome,
-            self._try_webdriver_manager_latest,
-            self._try_webdriver_manager_stable,
-            self._try_selenium_manager
-        ]
-        
-        for approach in approaches:
-            try:
-                self.driver = approach(chrome_options)
-                if self.driver:
-                    break
-            except Exception as e:
-                last_error = e
-                continue
-        
-        if not self.driver:
-            pytest.skip(f"Could not initialize Chrome WebDriver. Last error: {last_error}")
-        
-        self.driver.maximize_window()
-        self.wait = WebDriverWait(self.driver, self.TIMEOUT)
-        
-        yield
-        
-        # Teardown
-        if self.driver:
-            try:
-                self.driver.quit()
-            except:
-                pass
-    
-    def _try_system_chrome(self, chrome_options):
-        """Try to use system Chrome without webdriver-manager"""
-        return webdriver.Chrome(options=chrome_options)
-    
-    def _try_webdriver_manager_latest(self, chrome_options):
-        """Try webdriver-manager with latest version"""
-        service = Service(ChromeDriverManager().install())
-        return webdriver.Chrome(service=service, options=chrome_options)
+    def _goto(self, page, path="", wait_until="domcontentloaded"):
+        """Navigate to a frontend route, returning once the DOM is ready"""
+        page.goto(f"{FRONTEND_URL}{path}", wait_until=wait_until)
     
-    def _try_webdriver_manager_stable(self, chrome_options):
-        """Try webdriver-manager with known stable version"""
-        service = Service(ChromeDriverManager(version="119.0.6045.105").install())
-        return webdriver.Chrome(service=service, options=chrome_options)
-    
-    def _try_selenium_manager(self, chrome_options):
-        """Try using Selenium's built-in manager"""
-        # Clear any existing service
-        service = Service()
-        return webdriver.Chrome(service=service, options=chrome_options)
+    def _wait_for_redirect_or(self, page, form_selector):
+        """Wait until a protected page redirects to sign-in or renders its form"""
+        try:
+            page.wait_for_function(
+                "selector => location.href.includes('signin') || document.querySelector(selector)",
+                arg=form_selector
+            )
+        except PlaywrightError:
+            # Fall through to the test's own URL checks
+            pass
     
-    def test_01_homepage_loads(self):
+    def test_01_homepage_loads(self, page):
         """
         Test Case 1: Verify Homepage Loads Successfully
         -----------------------------------------------
@@ -111,25 +49,22 @@ class TestLiveQA:
         3. Verify key elements are present (hero section, features)
         """
         # Navigate to homepage
-        self.driver.get(self.BASE_URL)
+        self._goto(page)
         
         # Verify page loads
-        assert "Live" in self.driver.title or "Q&A" in self.driver.title or "QnA" in self.driver.title
+        title = page.title()
+        assert "Live" in title or "Q&A" in title or "QnA" in title
         
         # Verify hero section exists
         try:
-            hero_heading = self.wait.until(
-                EC.presence_of_element_located((By.XPATH, "//h1[contains(., 'Q&A') or contains(., 'QnA')]"))
-            )
-            assert hero_heading.is_displayed()
-        except TimeoutException:
+            hero_heading = page.locator("h1", has_text=re.compile(r"Q&A|QnA")).first
+            hero_heading.wait_for(state="attached")
+        except PlaywrightError:
             # Alternative check for any main heading
-            hero_heading = self.driver.find_element(By.TAG_NAME, "h1")
-            assert hero_heading.is_displayed()
-        
-        print("✓ Test 1 Passed: Homepage loads successfully")
+            hero_heading = page.locator("h1").first
+        assert hero_heading.is_visible()
     
-    def test_02_navigation_menu_visible(self):
+    def test_02_navigation_menu_visible(self, page):
         """
         Test Case 2: Verify Navigation Menu is Visible
         ----------------------------------------------
@@ -138,28 +73,22 @@ class TestLiveQA:
         2. Verify navigation bar is present
         3. Verify key navigation links exist (Sign In, Create Room, Join Room)
         """
-        self.driver.get(self.BASE_URL)
+        self._goto(page)
         
         # Check for navigation/header
-        nav_element = self.wait.until(
-            EC.presence_of_element_located((By.TAG_NAME, "nav"))
-        )
-        assert nav_element.is_displayed()
+        nav_element = page.locator("nav").first
+        nav_element.wait_for(state="attached")
+        assert nav_element.is_visible()
         
-        # Check for authentication links
+        # Check for authentication links (rendered once auth state hydrates)
+        sign_in_link = page.locator("a[href*='signin'], a[data-action='signin']").first
         try:
-            # Look for Sign In link
-            sign_in_link = self.driver.find_element(
-                By.XPATH, 
-                "//a[contains(@href, 'signin') or contains(text(), 'Sign In')]"
-            )
-            assert sign_in_link.is_displayed()
-        except NoSuchElementException:
+            sign_in_link.wait_for(state="attached")
+            assert sign_in_link.is_visible()
+        except PlaywrightError:
             print("Note: Sign In link not found on navigation")
-        
-        print("✓ Test 2 Passed: Navigation menu is visible")
     
-    def test_03_navigate_to_signin_page(self):
+    def test_03_navigate_to_signin_page(self, page):
         """
         Test Case 3: Navigate to Sign In Page
         -------------------------------------
@@ -168,23 +97,19 @@ class TestLiveQA:
         2. Click Sign In link
         3. Verify Sign In page loads with email and password fields
         """
-        self.driver.get(self.BASE_URL)
+        self._goto(page)
         
         # Navigate to Sign In page
-        self.driver.get(f"{self.BASE_URL}/auth/signin")
+        self._goto(page, "/auth/signin")
         
         # Verify Sign In form elements
-        email_input = self.wait.until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, "input[type='email'], input[name='email']"))
-        )
-        password_input = self.driver.find_element(By.CSS_SELECTOR, "input[type='password'], input[name='password']")
+        email_input = page.locator("input[type='email'], input[name='email']").first
+        password_input = page.locator("input[type='password'], input[name='password']").first
         
-        assert email_input.is_displayed()
-        assert password_input.is_displayed()
-        
-        print("✓ Test 3 Passed: Sign In page loads with required fields")
+        expect(email_input).to_be_visible()
+        expect(password_input).to_be_visible()
     
-    def test_04_signin_form_validation(self):
+    def test_04_signin_form_validation(self, page):
         """
         Test Case 4: Test Sign In Form Validation
         -----------------------------------------
@@ -193,40 +118,26 @@ class TestLiveQA:
         2. Submit form with empty fields
         3. Verify validation messages appear
         """
-        self.driver.get(f"{self.BASE_URL}/auth/signin")
-        
-        # Wait for page to load
-        time.sleep(1)
+        self._goto(page, "/auth/signin")
         
         # Find and click submit button without entering data
         try:
-            submit_button = self.driver.find_element(
-                By.XPATH, 
-                "//button[@type='submit' or contains(text(), 'Sign In')]"
-            )
-            submit_button.click()
-            
-            time.sleep(1)
+            page.locator("button[type=submit]").first.click()
             
-            # Check for validation message or error state
+            # Wait for validation message or error state
             # This could be HTML5 validation or custom validation
-            email_input = self.driver.find_element(By.CSS_SELECTOR, "input[type='email'], input[name='email']")
-            
-            # Check if input has validation state (HTML5 or custom)
-            is_invalid = (
-                email_input.get_attribute("required") is not None or
-                "invalid" in email_input.get_attribute("class") or
-                "error" in email_input.get_attribute("class")
+            email_input = page.locator("input[type='email'], input[name='email']").first
+            page.wait_for_function(
+                """el => el.hasAttribute('required') ||
+                    /invalid|error/.test(el.className) ||
+                    !!el.validationMessage""",
+                arg=email_input.element_handle()
             )
-            
-            assert is_invalid or email_input.get_attribute("validationMessage")
-            
+        
         except Exception as e:
             print(f"Validation check note: {str(e)}")
-        
-        print("✓ Test 4 Passed: Form validation works")
     
-    def test_05_navigate_to_create_room(self):
+    def test_05_navigate_to_create_room(self, page):
         """
         Test Case 5: Navigate to Create Room Page
         -----------------------------------------
@@ -234,12 +145,13 @@ class TestLiveQA:
         1. Navigate to Create Room page directly (requires auth)
         2. Verify redirect to sign-in or room creation form displays
         """
-        self.driver.get(f"{self.BASE_URL}/rooms/create")
+        self._goto(page, "/rooms/create")
         
-        # Wait for page to load
-        time.sleep(2)
+        # Wait for the auth redirect or the room creation form
+        title_selector = "input[name='title'], input[placeholder*='title' i]"
+        self._wait_for_redirect_or(page, title_selector)
         
-        current_url = self.driver.current_url
+        current_url = page.url
         
         # Either should see sign-in page (redirect) or create room page
         is_signin = "signin" in current_url
@@ -249,18 +161,10 @@ class TestLiveQA:
         
         if is_create_room:
             # Verify room creation form exists
-            try:
-                title_input = self.driver.find_element(
-                    By.CSS_SELECTOR, 
-                    "input[name='title'], input[placeholder*='title' i]"
-                )
-                assert title_input.is_displayed()
-            except:
+            if not page.locator(title_selector).first.is_visible():
                 print("Note: Create room form not immediately visible (may require auth)")
-        
-        print("✓ Test 5 Passed: Create Room page navigation works")
     
-    def test_06_navigate_to_join_room(self):
+    def test_06_navigate_to_join_room(self, page):
         """
         Test Case 6: Navigate to Join Room Page
         ---------------------------------------
@@ -269,30 +173,23 @@ class TestLiveQA:
         2. Verify room code input field is present
         3. Verify join button exists
         """
-        self.driver.get(f"{self.BASE_URL}/rooms/join")
+        self._goto(page, "/rooms/join")
         
-        time.sleep(2)
+        # Wait for the auth redirect or the join form
+        code_selector = "input[name='code'], input[placeholder*='code' i]"
+        self._wait_for_redirect_or(page, code_selector)
         
-        current_url = self.driver.current_url
+        current_url = page.url
         
         # Check if on join page or redirected to signin
         if "signin" in current_url:
             print("Note: Redirected to sign-in (authentication required)")
         elif "join" in current_url:
             # Verify room code input exists
-            try:
-                code_input = self.driver.find_element(
-                    By.CSS_SELECTOR,
-                    "input[name='code'], input[placeholder*='code' i]"
-                )
-                assert code_input.is_displayed()
-                print("✓ Room code input field found")
-            except:
+            if not page.locator(code_selector).first.is_visible():
                 print("Note: Join room form not visible (may require auth)")
-        
-        print("✓ Test 6 Passed: Join Room page accessible")
     
-    def test_07_theme_toggle_functionality(self):
+    def test_07_theme_toggle_functionality(self, page):
         """
         Test Case 7: Test Theme Toggle (Dark/Light Mode)
         ------------------------------------------------
@@ -302,38 +199,36 @@ class TestLiveQA:
         3. Click to toggle theme
         4. Verify theme changes (check for dark/light class on html/body)
         """
-        self.driver.get(self.BASE_URL)
+        self._goto(page, wait_until="load")
         
-        time.sleep(1)
+        # Look for theme toggle button (common patterns)
+        theme_button = page.locator("button[aria-label*='theme'], button[class*='theme']")
         
-        try:
-            # Look for theme toggle button (common patterns)
-            theme_button = self.driver.find_element(
-                By.XPATH,
-                "//button[contains(@aria-label, 'theme') or contains(@class, 'theme')]"
-            )
-            
+        if theme_button.count():
             # Get initial theme
-            html_element = self.driver.find_element(By.TAG_NAME, "html")
-            initial_class = html_element.get_attribute("class")
+            initial_class = page.evaluate("document.documentElement.className")
             
             # Click theme toggle
-            theme_button.click()
-            time.sleep(0.5)
+            theme_button.first.click()
+            
+            # Wait for the theme class to change
+            try:
+                page.wait_for_function(
+                    "initial => document.documentElement.className !== initial",
+                    arg=initial_class
+                )
+            except PlaywrightError:
+                pass
             
             # Get new theme
-            updated_class = html_element.get_attribute("class")
+            updated_class = page.evaluate("document.documentElement.className")
             
             # Verify theme changed
             assert initial_class != updated_class
-            print("✓ Theme toggle works")
-            
-        except NoSuchElementException:
+        else:
             print("Note: Theme toggle button not found")
-        
-        print("✓ Test 7 Passed: Theme functionality tested")
     
-    def test_08_footer_links_present(self):
+    def test_08_footer_links_present(self, page):
         """
         Test Case 8: Verify Footer Links are Present
         --------------------------------------------
@@ -342,29 +237,24 @@ class TestLiveQA:
         2. Scroll to footer
         3. Verify footer exists and contains links/information
         """
-        self.driver.get(self.BASE_URL)
+        self._goto(page)
         
-        # Scroll to bottom
-        self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-        time.sleep(1)
+        # Scroll to bottom and inspect the footer in a single round trip
+        footer = page.evaluate("""() => {
+            window.scrollTo(0, document.body.scrollHeight);
+            const f = document.querySelector('footer');
+            return f ? {visible: f.offsetParent !== null, links: f.querySelectorAll('a').length} : null;
+        }""")
         
-        try:
-            # Look for footer element
-            footer = self.driver.find_element(By.TAG_NAME, "footer")
-            assert footer.is_displayed()
-            
-            # Check for any links in footer
-            footer_links = footer.find_elements(By.TAG_NAME, "a")
-            assert len(footer_links) >= 0  # Footer may or may not have links
-            
-            print(f"✓ Footer found with {len(footer_links)} links")
+        if footer:
+            assert footer["visible"]
             
-        except NoSuchElementException:
+            # Footer may or may not have links
+            assert footer["links"] >= 0
+        else:
             print("Note: Footer element not found")
-        
-        print("✓ Test 8 Passed: Footer section verified")
     
-    def test_09_responsive_design_mobile_view(self):
+    def test_09_responsive_design_mobile_view(self, mobile_page):
         """
         Test Case 9: Test Responsive Design (Mobile View)
         -------------------------------------------------
@@ -374,29 +264,28 @@ class TestLiveQA:
         3. Verify page renders without horizontal scroll
         4. Verify key elements are still visible
         """
-        # Set mobile viewport (iPhone 12 Pro size)
-        self.driver.set_window_size(390, 844)
-        
-        self.driver.get(self.BASE_URL)
-        time.sleep(1)
+        # Mobile viewport (iPhone 12 Pro size) comes from a dedicated context
+        self._goto(mobile_page, wait_until="load")
+        
+        # Collect page and viewport widths plus heading visibility in one round trip
+        data = mobile_page.evaluate("""() => {
+            const h1 = document.querySelector('h1');
+            return {
+                bw: document.body.scrollWidth,
+                vw: window.innerWidth,
+                h1: !!h1 && h1.offsetParent !== null
+            };
+        }""")
         
         # Check if page width fits viewport (no horizontal scroll)
-        body_width = self.driver.execute_script("return document.body.scrollWidth")
-        viewport_width = self.driver.execute_script("return window.innerWidth")
-        
         # Allow small variance for scrollbar
-        assert body_width <= viewport_width + 20, "Horizontal scroll detected in mobile view"
+        assert data["bw"] <= data["vw"] + 20, "Horizontal scroll detected in mobile view"
         
         # Verify main heading is visible
-        try:
-            main_heading = self.driver.find_element(By.TAG_NAME, "h1")
-            assert main_heading.is_displayed()
-        except:
+        if not data["h1"]:
             print("Note: Main heading visibility check inconclusive")
-        
-        print("✓ Test 9 Passed: Responsive design verified")
     
-    def test_10_page_load_performance(self):
+    def test_10_page_load_performance(self, full_page):
         """
         Test Case 10: Test Page Load Performance
         ----------------------------------------
@@ -405,25 +294,22 @@ class TestLiveQA:
         2. Measure page load time using Navigation Timing API
         3. Verify page loads within acceptable time (< 5 seconds)
         """
+        # Measure with a page that still loads images
         start_time = time.time()
-        self.driver.get(self.BASE_URL)
         
         # Wait for page to be fully loaded
-        self.wait.until(
-            lambda driver: driver.execute_script("return document.readyState") == "complete"
-        )
+        self._goto(full_page, wait_until="load")
         
         end_time = time.time()
         load_time = end_time - start_time
         
-        # Get more accurate timing from browser
-        navigation_timing = self.driver.execute_script(
-            "return window.performance.timing"
-        )
+        # Get more accurate timing from browser once the load event has finished
+        full_page.wait_for_function("() => window.performance.timing.loadEventEnd > 0")
+        navigation_timing = full_page.evaluate("() => window.performance.timing.toJSON()")
         
         if navigation_timing:
             page_load_time = (
-                navigation_timing['loadEventEnd'] - 
+                navigation_timing['loadEventEnd'] -
                 navigation_timing['navigationStart']
             ) / 1000.0  # Convert to seconds
             
@@ -432,10 +318,11 @@ class TestLiveQA:
         else:
             print(f"✓ Measured load time: {load_time:.2f} seconds")
             assert load_time < 10, f"Page load time too slow: {load_time}s"
-        
-        print("✓ Test 10 Passed: Page load performance acceptable")
 
 
 if __name__ == "__main__":
-    # Run tests with pytest
-    pytest.main([__file__, "-v", "--html=test_report.html", "--self-contained-html"])
+    # Run tests with pytest (set GEN_HTML=1 to also write an HTML report)
+    args = [__file__, "-v", "--tb=line", "-p", "no:cacheprovider"]
+    if os.getenv("GEN_HTML"):
+        args += ["--html=test_report.html", "--self-contained-html"]
+    pytest.main(args)